@@ -1,2 +1,7 @@
 from .crawling import *
 from .latlng import *
+from .retention import *
+from .gazetteer import *
+from .export import *
+from .pipeline import *
+from .changefeed import *
@@ -0,0 +1,78 @@
+import logging
+import select
+from typing import Dict, Iterator, List
+
+from sqlalchemy import Engine, text
+
+OUTBOX_TABLE_NAME = "campaign_outbox"
+CHANGE_CHANNEL = "campaign_changes"
+
+# 아웃박스에 쓰는 트랜잭션을 직렬화하는 advisory lock 키.
+# 커밋 순서와 outbox id 순서를 일치시켜, id 기준으로 이어 읽는 소비자가
+# 늦게 커밋된 작은 id를 건너뛰지 않도록 합니다.
+OUTBOX_LOCK_KEY = 7_302_001
+
+
+def fetch_changes(engine: Engine, after_id: int = 0, limit: int = 1000) -> List[Dict]:
+    """after_id 이후에 기록된 변경 이벤트를 id 순서대로 최대 limit개 불러옵니다."""
+    query = text(
+        f'SELECT id, campaign_id, op, payload, created_at FROM "{OUTBOX_TABLE_NAME}" '
+        "WHERE id > :after_id ORDER BY id LIMIT :limit"
+    )
+    with engine.connect() as connection:
+        rows = connection.execute(query, {"after_id": after_id, "limit": limit})
+        return [dict(row._mapping) for row in rows]
+
+
+def tail_changes(
+    engine: Engine,
+    after_id: int = 0,
+    batch_size: int = 1000,
+    idle_timeout: float = 30,
+) -> Iterator[Dict]:
+    """
+    변경 이벤트를 계속 이어서 반환하는 제너레이터입니다.
+    밀린 이벤트를 먼저 모두 읽은 뒤, LISTEN으로 NOTIFY를 기다렸다가 다시 읽습니다.
+    알림을 놓치더라도 idle_timeout마다 한 번씩 다시 조회합니다.
+    소비자는 마지막으로 처리한 이벤트의 id를 저장해 두었다가 after_id로 넘기면 됩니다.
+    """
+    raw_conn = engine.raw_connection()
+    # autocommit + LISTEN 상태의 연결이 풀로 돌아가 다른 트랜잭션(advisory lock)에
+    # 재사용되지 않도록 풀에서 분리합니다. close() 시 실제로 연결이 닫힙니다.
+    raw_conn.detach()
+    try:
+        listen_conn = raw_conn.dbapi_connection
+        listen_conn.autocommit = True
+        with listen_conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANGE_CHANNEL};")
+
+        while True:
+            changes = fetch_changes(engine, after_id=after_id, limit=batch_size)
+            for change in changes:
+                yield change
+                after_id = change["id"]
+            if len(changes) == batch_size:
+                continue
+
+            # 새 이벤트 알림이 오거나 idle_timeout이 지날 때까지 대기합니다.
+            select.select([listen_conn], [], [], idle_timeout)
+            listen_conn.poll()
+            listen_conn.notifies.clear()
+    finally:
+        raw_conn.close()
+
+
+def purge_changes(engine: Engine, older_than_days: int = 7) -> int:
+    """보관 기간이 지난 변경 이벤트를 삭제하고 삭제한 개수를 반환합니다."""
+    query = text(
+        f'DELETE FROM "{OUTBOX_TABLE_NAME}" '
+        "WHERE created_at < NOW() - make_interval(days => :days)"
+    )
+    try:
+        with engine.begin() as connection:
+            deleted = connection.execute(query, {"days": older_than_days}).rowcount
+        logging.info(f"오래된 변경 이벤트 {deleted}개를 삭제했습니다.")
+        return deleted
+    except Exception as e:
+        logging.error(f"변경 이벤트 정리 실패: {e}")
+        return 0
@@ -1,14 +1,19 @@
 import pandas as pd
+import hashlib
 import io
 import time
 import os
 import logging
+import signal
+import subprocess
+import threading
+from collections import Counter, deque
 from tqdm import tqdm
 
 # types
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 from pandas import DataFrame
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, text
 from sqlalchemy.types import VARCHAR, TEXT, BIGINT  # 데이터 타입 지정을 위해 추가
 
 # selenium
@@ -25,6 +30,10 @@ from dotenv import load_dotenv
 
 import psycopg2
 
+from .changefeed import CHANGE_CHANNEL, OUTBOX_LOCK_KEY, OUTBOX_TABLE_NAME
+from .log import RunCounters, setup_queue_logging
+from .retention import RETENTION_GRACE_DAYS
+
 
 class AdvancedScraper:
     """
@@ -42,33 +51,35 @@ class AdvancedScraper:
             setattr(self, key, value)
 
         self.driver = self._initialize_driver()
+        # 키워드별 시간 예산을 위한 상태 (execute_scraping에서 설정)
+        self._keyword_deadline = None
+        self._keyword_timed_out = False
         self.db_engine = self._get_db_engine()
         self.logger.info("스크레이퍼 초기화가 완료되었습니다.")
 
     def _setup_logger(self):
-        """로거를 설정합니다. 파일과 콘솔에 모두 출력합니다."""
+        """
+        로거를 설정합니다. 파일과 콘솔에 모두 출력하되, 실제 출력은
+        큐 리스너 스레드가 담당하여 스크래핑 루프가 디스크 I/O를 기다리지 않습니다.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.setLevel(logging.INFO)
-
-        if self.logger.hasHandlers():
-            self.logger.handlers.clear()
-
-        stream_handler = logging.StreamHandler()
-        stream_format = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        stream_handler.setFormatter(stream_format)
-        self.logger.addHandler(stream_handler)
-
-        file_handler = logging.FileHandler("scraper.log")
-        file_format = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(file_format)
-        self.logger.addHandler(file_handler)
+        # 콘솔 출력은 자체 리스너가 담당하므로 루트 로거로 중복 전파하지 않습니다.
+        self.logger.propagate = False
+        self._log_listener = setup_queue_logging(self.logger, file_path="scraper.log")
+        self.counters = RunCounters()
 
     def _initialize_driver(self) -> webdriver.Chrome:
         """셀레니움 웹 드라이버를 초기화하고 반환합니다."""
         self.logger.info("Chrome 드라이버를 설정합니다...")
-        service = ChromeService(executable_path=ChromeDriverManager().install())
+        # 드라이버 재시작 시 네트워크를 다시 타지 않도록 설치 경로를 재사용합니다.
+        if not getattr(self, "_driver_path", None):
+            self._driver_path = ChromeDriverManager().install()
+        # chromedriver를 별도 세션(프로세스 그룹)으로 띄워, 강제 종료 시
+        # 하위 Chrome 프로세스까지 함께 정리할 수 있게 합니다.
+        popen_kw = {} if os.name == "nt" else {"start_new_session": True}
+        service = ChromeService(executable_path=self._driver_path, popen_kw=popen_kw)
+        # 워치독이 시작 중인 드라이버도 종료할 수 있도록 보관합니다.
+        self._service = service
         options = webdriver.ChromeOptions()
 
         if hasattr(self, "headless") and self.headless:
@@ -80,6 +91,93 @@ class AdvancedScraper:
         driver = webdriver.Chrome(service=service, options=options)
         return driver
 
+    def _remaining_budget(self, default: float = 10) -> float:
+        """현재 키워드의 남은 시간 예산 내에서 사용할 대기 시간을 계산합니다."""
+        if self._keyword_deadline is None:
+            return default
+        remaining = self._keyword_deadline - time.monotonic()
+        return max(0.1, min(default, remaining))
+
+    def _is_driver_responsive(self, timeout: float = 5) -> bool:
+        """별도 스레드에서 드라이버에 간단한 명령을 보내 응답 여부를 확인합니다."""
+        result = {}
+
+        def ping():
+            try:
+                result["title"] = self.driver.title
+            except Exception:
+                pass
+
+        probe = threading.Thread(target=ping, daemon=True)
+        probe.start()
+        probe.join(timeout)
+        return "title" in result
+
+    def _kill_driver(self):
+        """응답 없는 chromedriver와 그 하위 Chrome 프로세스를 모두 강제로 종료합니다."""
+        process = getattr(getattr(self, "_service", None), "process", None)
+        if process is None:
+            return
+        try:
+            if os.name == "nt":
+                subprocess.run(
+                    ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                    capture_output=True,
+                )
+            else:
+                # start_new_session으로 띄웠으므로 프로세스 그룹 ID는 chromedriver의 PID입니다.
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"드라이버 프로세스 강제 종료 실패: {e}")
+
+    def _on_keyword_timeout(self, keyword: str):
+        """워치독 타이머 콜백: 시간 예산을 넘긴 키워드의 드라이버를 종료합니다."""
+        self._keyword_timed_out = True
+        self.logger.warning(
+            f"'{keyword}' 처리 시간이 예산을 초과했습니다. 드라이버를 종료합니다."
+        )
+        self._kill_driver()
+
+    def _restart_driver(
+        self, implicitly_wait: int, page_load_timeout: float, max_attempts: int = 3
+    ):
+        """
+        기존 드라이버를 정리하고 새 드라이버로 교체한 뒤 메인 페이지로 이동합니다.
+        재시작 자체도 page_load_timeout 초의 워치독 아래에서 수행하고,
+        실패하면 max_attempts 회까지 다시 시도합니다.
+        """
+        self.logger.warning("드라이버를 재시작합니다.")
+        self._kill_driver()
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+        for attempt in range(1, max_attempts + 1):
+            self._keyword_deadline = time.monotonic() + page_load_timeout
+            watchdog = threading.Timer(page_load_timeout, self._kill_driver)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                self.driver = self._initialize_driver()
+                self.driver.implicitly_wait(implicitly_wait)
+                self.driver.set_page_load_timeout(page_load_timeout)
+                self._navigate_to()
+                return
+            except Exception as e:
+                self.logger.warning(
+                    f"드라이버 재시작 실패 ({attempt}/{max_attempts}): {e}"
+                )
+                self._kill_driver()
+            finally:
+                watchdog.cancel()
+                self._keyword_deadline = None
+
+        self.logger.critical("드라이버를 재시작하지 못했습니다.")
+        raise RuntimeError(f"드라이버 재시작이 {max_attempts}회 모두 실패했습니다.")
+
     def _get_db_engine(self) -> Engine:
         """환경변수를 로드하고 SQLAlchemy DB 엔진을 생성합니다."""
         self.logger.info("데이터베이스 연결 엔진을 생성합니다.")
@@ -92,7 +190,11 @@ class AdvancedScraper:
             raise
 
     def _search_keyword(self, keyword: str):
-        """주어진 키워드로 웹사이트에서 검색을 수행합니다."""
+        """
+        주어진 키워드로 웹사이트에서 검색을 수행합니다.
+        결과 테이블이 시간 내에 로드되지 않으면 TimeoutException을 다시 발생시켜
+        호출한 쪽에서 해당 키워드를 나중에 재시도할 수 있게 합니다.
+        """
         try:
             self.logger.info(f"키워드 검색 시작: '{keyword}'")
             search_box = self.driver.find_element(
@@ -106,7 +208,7 @@ class AdvancedScraper:
             search_btn.click()
 
             # [수정] time.sleep() 대신 명시적 대기 사용
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(self.driver, self._remaining_budget()).until(
                 EC.presence_of_element_located((By.ID, "result_table"))
             )
             self.logger.info(f"'{keyword}' 검색 결과 로딩 완료.")
@@ -115,27 +217,37 @@ class AdvancedScraper:
             self.logger.warning(
                 f"'{keyword}' 검색 결과 테이블이 시간 내에 로드되지 않았습니다."
             )
+            raise
         except NoSuchElementException as e:
             self.logger.error(f"검색 입력창 또는 버튼을 찾지 못했습니다: {e}")
             raise
 
-    def _extract_dataframe_from_page(self, search_text: str = None) -> DataFrame:
-        """현재 페이지에서 테이블의 각 행을 순회하며 데이터를 추출하고, 링크를 포함한 DataFrame을 생성합니다."""
+    def _extract_dataframe_from_page(
+        self, search_text: str = None, rows: Optional[list] = None
+    ) -> DataFrame:
+        """
+        현재 페이지에서 테이블의 각 행을 순회하며 데이터를 추출하고, 링크를 포함한 DataFrame을 생성합니다.
+        rows가 주어지면 테이블을 다시 찾지 않고 해당 행(tr) 요소들에서 추출합니다.
+        """
         try:
-            # 테이블이 나타날 때까지 대기
-            wait = WebDriverWait(self.driver, 10)
-            table_body = wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "#result_table > tbody")
+            if rows is None:
+                # 테이블이 나타날 때까지 대기
+                wait = WebDriverWait(self.driver, self._remaining_budget())
+                table_body = wait.until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "#result_table > tbody")
+                    )
+                )
+                self.logger.info(
+                    "'result_table > tbody' 요소를 성공적으로 찾았습니다."
                 )
-            )
-            self.logger.info("'result_table > tbody' 요소를 성공적으로 찾았습니다.")
 
-            # 테이블의 모든 행(tr)을 가져옵니다.
-            rows = table_body.find_elements(By.TAG_NAME, "tr")
+                # 테이블의 모든 행(tr)을 가져옵니다.
+                rows = table_body.find_elements(By.TAG_NAME, "tr")
             self.logger.info(
                 f"{len(rows)}개의 행을 찾았습니다. 데이터 추출을 시작합니다."
             )
+            self.counters.incr("rows_seen", len(rows))
 
             # 각 행의 데이터를 저장할 리스트
             all_rows_data = []
@@ -161,8 +273,10 @@ class AdvancedScraper:
                     )
                 except NoSuchElementException:
                     company_link = None  # a 태그가 없는 경우를 대비
+                    self.counters.incr("missing_link")
                     self.logger.warning(
-                        f"'{company_name}' 업체에서 링크(a 태그)를 찾지 못했습니다."
+                        f"'{company_name}' 업체에서 링크(a 태그)를 찾지 못했습니다.",
+                        extra={"sample_key": "missing_link"},
                     )
 
                 # 추출한 데이터를 딕셔너리 형태로 리스트에 추가합니다.
@@ -228,7 +342,8 @@ class AdvancedScraper:
         )
 
         # --- 날짜/시간 컬럼 처리 ---
-        current_year = pd.Timestamp.now().year
+        today = pd.Timestamp.now(tz="Asia/Seoul").tz_localize(None).normalize()
+        current_year = today.year
         for col in ["apply_deadline", "review_deadline"]:
             # 1. 문자열을 datetime 객체로 변환 (실패 시 NaT)
             date_series = pd.to_datetime(
@@ -237,6 +352,17 @@ class AdvancedScraper:
                 format="%Y/%m/%d",
             )
 
+            # 1-1. 연도 경계 보정: 12월에 수집한 1월 마감일은 내년,
+            #      1월에 수집한 12월 마감일은 작년 날짜로 해석합니다.
+            #      (보정하지 않으면 진행 중인 캠페인이 만료로 아카이브됩니다.)
+            half_year = pd.DateOffset(months=6)
+            date_series = date_series.mask(
+                date_series < today - half_year, date_series + pd.DateOffset(years=1)
+            )
+            date_series = date_series.mask(
+                date_series > today + half_year, date_series - pd.DateOffset(years=1)
+            )
+
             # 2. 타임존 정보 부여 (결과에 NaT 포함)
             aware_datetime = date_series.dt.tz_localize("Asia/Seoul")
 
@@ -270,20 +396,82 @@ class AdvancedScraper:
         self.logger.info(f"데이터 정제 완료. 최종 {len(df)} 행.")
         return df
 
+    def _hash_result_table(self) -> Optional[str]:
+        """현재 검색 결과 테이블(tbody) 내용의 해시를 계산합니다. 테이블이 없으면 None."""
+        try:
+            table_body = self.driver.find_element(
+                By.CSS_SELECTOR, "#result_table > tbody"
+            )
+        except NoSuchElementException:
+            return None
+        snapshot = table_body.get_attribute("innerHTML") or ""
+        return hashlib.sha256(snapshot.encode("utf-8")).hexdigest()
+
+    def _read_result_table(
+        self, search_text: str = None, previous_fingerprint: Optional[str] = None
+    ) -> Tuple[DataFrame, Optional[str], bool]:
+        """
+        결과 테이블을 읽어 (DataFrame, 테이블 해시, 변경 없음 여부)를 반환합니다.
+
+        행이 렌더링될 때까지 기다린 뒤 해시를 계산하고, 그 다음에 행을 다시 읽어
+        추출합니다. 추출이 끝난 뒤 해시를 한 번 더 계산하여 두 해시가 같을 때만
+        (즉, 추출한 행이 해시한 테이블 상태와 같을 때만) 해시를 반환합니다.
+        해시가 previous_fingerprint와 같으면 추출을 건너뛰고 변경 없음으로 반환합니다.
+        테이블이 시간 내에 나타나지 않으면 TimeoutException이 발생합니다.
+        """
+        table_body = WebDriverWait(self.driver, self._remaining_budget()).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#result_table > tbody"))
+        )
+        # implicitly_wait 동안 첫 행이 나타날 때까지 기다립니다.
+        if not table_body.find_elements(By.TAG_NAME, "tr"):
+            return self._extract_dataframe_from_page(search_text, rows=[]), None, False
+
+        fingerprint_before = self._hash_result_table()
+        if fingerprint_before and fingerprint_before == previous_fingerprint:
+            return pd.DataFrame(), fingerprint_before, True
+
+        rows = table_body.find_elements(By.TAG_NAME, "tr")
+        df = self._extract_dataframe_from_page(search_text, rows=rows)
+
+        # 추출하는 동안 테이블이 바뀌었다면 추출한 행과 해시가 어긋나므로 버립니다.
+        fingerprint_after = self._hash_result_table()
+        if fingerprint_before != fingerprint_after:
+            self.logger.info("추출 중 결과 테이블이 바뀌어 fingerprint를 저장하지 않습니다.")
+            return df, None, False
+        return df, fingerprint_before, False
+
     def _navigate_to(self, path: str = "/"):
         """베이스 URL 기준으로 특정 경로로 이동합니다."""
         target_url = f"{self.base_url}{path}"
         self.logger.info(f"페이지 이동: {target_url}")
         self.driver.get(target_url)
 
-    def _upsert_data_to_db(self, df: DataFrame, table_name: str):
+    def _drop_expired_rows(self, df: DataFrame) -> DataFrame:
+        """
+        archive_expired_campaigns와 같은 기준으로 이미 마감된 캠페인을 제외합니다.
+        사이트에 남아 있는 마감 캠페인이 hot 테이블에 새 id로 다시 들어오지 않게 합니다.
+        """
+        if df.empty:
+            return df
+        cutoff = pd.Timestamp.now(tz="Asia/Seoul") - pd.Timedelta(
+            days=RETENTION_GRACE_DAYS
+        )
+        is_live = pd.to_datetime(df["apply_deadline"], utc=True) >= cutoff
+        expired = int((~is_live).sum())
+        if expired:
+            self.counters.incr("rows_expired_skipped", expired)
+            self.logger.info(f"이미 마감된 캠페인 {expired}개 행을 저장하지 않습니다.")
+        return df[is_live]
+
+    def _upsert_data_to_db(self, df: DataFrame, table_name: str) -> List[int]:
         """
         주어진 DataFrame을 데이터베이스에 UPSERT합니다.
         (ON CONFLICT ... DO UPDATE)
+        새로 추가되었거나 내용이 바뀐 행의 id 목록을 반환합니다.
         """
         if df.empty:
             self.logger.warning("저장할 데이터가 없어 DB 저장을 건너뜁니다.")
-            return
+            return []
 
         self.logger.info(f"'{table_name}' 테이블에 {df.shape[0]}개 행 UPSERT 시작...")
 
@@ -311,15 +499,46 @@ class AdvancedScraper:
         for col in conflict_cols:
             df_cleaned[col].fillna("", inplace=True)
             df_cleaned[col] = df_cleaned[col].str.strip()
-            self.logger.info(f"'{col}' 컬럼의 null 값을 빈 문자열로 처리했습니다.")
+        self.logger.debug(
+            f"{conflict_cols} 컬럼의 null 값을 빈 문자열로 처리했습니다."
+        )
 
-        update_cols = [col for col in cols_in_order if col not in conflict_cols]
+        # 보강(enrich) 단계가 채우는 컬럼은 재수집 시 덮어쓰지 않습니다.
+        enrich_cols = ["address", "lat", "lng", "img_url"]
+        update_cols = [
+            col
+            for col in cols_in_order
+            if col not in conflict_cols and col not in enrich_cols
+        ]
 
-        sql_insert = f"INSERT INTO {table_name} ({', '.join(cols_in_order)}) VALUES %s"
+        sql_insert = f"INSERT INTO {table_name} ({', '.join(cols_in_order)}) VALUES %s "
         sql_conflict = f"ON CONFLICT ({', '.join(conflict_cols)}) DO UPDATE SET "
-        sql_update = ", ".join([f"{col} = EXCLUDED.{col}" for col in update_cols])
+        sql_update = ", ".join(
+            [f"{col} = EXCLUDED.{col}" for col in update_cols] + ["updated_at = NOW()"]
+        )
+        # 내용이 바뀐 행만 갱신하여 RETURNING에 신규/변경 행만 포함되도록 합니다.
+        sql_where = (
+            f" WHERE ({', '.join(f'{table_name}.{col}' for col in update_cols)})"
+            f" IS DISTINCT FROM ({', '.join(f'EXCLUDED.{col}' for col in update_cols)})"
+        )
+
+        # xmax = 0 이면 새로 INSERT된 행, 아니면 UPDATE된 행입니다.
+        sql_returning = (
+            f" RETURNING {table_name}.*, ({table_name}.xmax = 0) AS inserted"
+        )
 
-        upsert_sql = sql_insert + sql_conflict + sql_update + ";"
+        # 신규/변경 행을 같은 문장에서 아웃박스에 기록하여 한 트랜잭션으로 묶습니다.
+        upsert_sql = (
+            "WITH upserted AS ("
+            + sql_insert
+            + sql_conflict
+            + sql_update
+            + sql_where
+            + sql_returning
+            + f") INSERT INTO {OUTBOX_TABLE_NAME} (campaign_id, op, payload) "
+            "SELECT id, CASE WHEN inserted THEN 'insert' ELSE 'update' END, "
+            "to_jsonb(upserted) - 'inserted' FROM upserted RETURNING campaign_id;"
+        )
 
         conn = None
         try:
@@ -329,10 +548,25 @@ class AdvancedScraper:
             # [수정] 정리된 df_cleaned를 사용합니다.
             values = [tuple(x) for x in df_cleaned.to_numpy()]
 
-            psycopg2.extras.execute_values(cursor, upsert_sql, values)
+            cursor.execute("SELECT pg_advisory_xact_lock(%s);", (OUTBOX_LOCK_KEY,))
+            returned = psycopg2.extras.execute_values(
+                cursor, upsert_sql, values, fetch=True
+            )
+            changed_ids = [row[0] for row in returned]
+            if changed_ids:
+                # NOTIFY는 커밋 시점에 전달됩니다.
+                cursor.execute(
+                    "SELECT pg_notify(%s, %s);", (CHANGE_CHANNEL, str(len(changed_ids)))
+                )
+            self.counters.incr("rows_upserted", len(values))
+            self.counters.incr("rows_changed", len(changed_ids))
 
             conn.commit()
-            self.logger.info(f"데이터베이스에 성공적으로 UPSERT 했습니다.")
+            self.logger.info(
+                f"데이터베이스에 성공적으로 UPSERT 했습니다. "
+                f"(신규/변경 {len(changed_ids)}개 행)"
+            )
+            return changed_ids
         except Exception as e:
             self.logger.error(f"데이터베이스 UPSERT 중 오류 발생: {e}")
             if conn:
@@ -343,25 +577,191 @@ class AdvancedScraper:
                 cursor.close()
                 conn.close()
 
+    def _load_keyword_fingerprints(self, fingerprint_table: str) -> Dict[str, Tuple]:
+        """키워드별로 저장된 (결과 테이블 해시, 행 개수)를 불러옵니다."""
+        query = f"SELECT search_text, fingerprint, row_count FROM {fingerprint_table}"
+        try:
+            df = pd.read_sql_query(query, self.db_engine)
+        except Exception as e:
+            self.logger.warning(
+                f"키워드 fingerprint 로딩 실패, 모든 키워드를 처리합니다: {e}"
+            )
+            return {}
+        return {
+            row.search_text: (row.fingerprint, row.row_count)
+            for row in df.itertuples(index=False)
+        }
+
+    def _save_keyword_fingerprint(
+        self, fingerprint_table: str, keyword: str, fingerprint: str, row_count: int
+    ):
+        """키워드의 결과 테이블 해시를 저장합니다. 실패해도 스크래핑은 계속합니다."""
+        query = text(
+            f"INSERT INTO {fingerprint_table} (search_text, fingerprint, row_count) "
+            "VALUES (:search_text, :fingerprint, :row_count) "
+            "ON CONFLICT (search_text) DO UPDATE SET "
+            "fingerprint = EXCLUDED.fingerprint, row_count = EXCLUDED.row_count, "
+            "updated_at = NOW()"
+        )
+        try:
+            with self.db_engine.begin() as connection:
+                connection.execute(
+                    query,
+                    {
+                        "search_text": keyword,
+                        "fingerprint": fingerprint,
+                        "row_count": row_count,
+                    },
+                )
+        except Exception as e:
+            self.logger.warning(f"'{keyword}' fingerprint 저장 실패: {e}")
+
+    def _log_latency_report(self, durations: List[float], stats: Counter):
+        """키워드별 처리 시간 분포와 타임아웃/재시도 통계를 로깅합니다."""
+        if not durations:
+            return
+        latency = pd.Series(durations)
+        self.logger.info(
+            f"키워드 처리 시간: p50 {latency.quantile(0.5):.1f}s, "
+            f"p95 {latency.quantile(0.95):.1f}s, 최대 {latency.max():.1f}s "
+            f"(시간 초과 {stats['timed_out']}회, 재시도 {stats['retried']}회, "
+            f"포기 {stats['abandoned']}개 키워드)"
+        )
+
     def execute_scraping(
-        self, keywords: List[str], table_name: str, implicitly_wait: int = 5
+        self,
+        keywords: List[str],
+        table_name: str,
+        implicitly_wait: int = 5,
+        keyword_timeout: float = 60,
+        max_retries: int = 1,
+        on_upserted: Optional[Callable[[List[int]], None]] = None,
+        skip_unchanged: bool = True,
+        fingerprint_table: str = "keyword_fingerprint",
     ):
-        """전체 스크래핑 및 저장 워크플로우를 실행합니다."""
+        """
+        전체 스크래핑 및 저장 워크플로우를 실행합니다.
+        키워드마다 keyword_timeout 초의 시간 예산을 두고, 워치독이 예산을 넘기거나
+        응답 없는 드라이버를 감지하면 드라이버를 재시작한 뒤 해당 키워드를
+        실행 후반부에 최대 max_retries 회 다시 시도합니다.
+        검색 결과는 키워드마다 바로 UPSERT하며, 신규/변경된 행의 id 목록을
+        on_upserted 콜백으로 넘겨 다음 키워드를 처리하는 동안 보강할 수 있게 합니다.
+        skip_unchanged가 True이면 결과 테이블 해시가 지난 실행과 같은 키워드는
+        추출/정제/UPSERT를 건너뛰며, 반환되는 DataFrame에도 포함되지 않습니다.
+        """
         self._navigate_to()
         self.driver.implicitly_wait(implicitly_wait)
+        self.driver.set_page_load_timeout(keyword_timeout)
 
         df_list = []
-        for keyword in tqdm(keywords, desc="키워드 검색 진행률"):
-            self._search_keyword(keyword)
+        durations = []
+        stats = Counter()
+        attempts = Counter()
+        pending = deque(keywords)
+        fingerprints = (
+            self._load_keyword_fingerprints(fingerprint_table) if skip_unchanged else {}
+        )
+        progress = tqdm(total=len(keywords), desc="키워드 검색 진행률")
+        while pending:
+            keyword = pending.popleft()
+            attempts[keyword] += 1
+
+            started = time.monotonic()
+            self._keyword_deadline = started + keyword_timeout
+            self._keyword_timed_out = False
+            watchdog = threading.Timer(
+                keyword_timeout, self._on_keyword_timeout, args=(keyword,)
+            )
+            watchdog.daemon = True
+            watchdog.start()
+
+            failed = False
+            driver_broken = False
+            unchanged = False
+            fingerprint = None
+            temp_df = pd.DataFrame()
+            try:
+                self._search_keyword(keyword)
+
+                previous = fingerprints.get(keyword)
+                temp_df, fingerprint, unchanged = self._read_result_table(
+                    search_text=keyword,
+                    previous_fingerprint=previous[0] if previous else None,
+                )
+                if not temp_df.empty:
+                    temp_df["keyword"] = keyword  # 나중에 search_text로 변환됨
+
+                # [수정] 검색 후 메인 페이지로 돌아갈 필요가 없다면 아래 라인 삭제 가능
+                self._navigate_to()
+            except TimeoutException:
+                # 결과 테이블이 로드되지 않은 키워드는 0건이 아니라 실패로 보고 재시도합니다.
+                self.logger.warning(f"'{keyword}' 검색 결과 대기 시간 초과.")
+                failed = True
+                try:
+                    self._navigate_to()
+                except Exception:
+                    driver_broken = True
+            except Exception as e:
+                # 드라이버가 정상이라면 기존처럼 예외를 그대로 전파합니다.
+                if not self._keyword_timed_out and self._is_driver_responsive():
+                    raise
+                self.logger.error(f"'{keyword}' 처리 중 드라이버 오류 발생: {e}")
+                failed = True
+                driver_broken = True
+            finally:
+                watchdog.cancel()
+                self._keyword_deadline = None
+                durations.append(time.monotonic() - started)
+
+            self.counters.incr("keywords_attempted")
+            if self._keyword_timed_out:
+                stats["timed_out"] += 1
+            if driver_broken or self._keyword_timed_out:
+                self._restart_driver(implicitly_wait, keyword_timeout)
+            if failed:
+                if attempts[keyword] <= max_retries:
+                    self.logger.info(f"'{keyword}' 키워드를 나중에 다시 시도합니다.")
+                    stats["retried"] += 1
+                    pending.append(keyword)
+                    continue
+                self.logger.error(f"'{keyword}' 키워드는 재시도 후에도 실패했습니다.")
+                stats["abandoned"] += 1
 
-            temp_df = self._extract_dataframe_from_page(search_text=keyword)
+            temp_df = self._drop_expired_rows(temp_df)
             if not temp_df.empty:
-                temp_df["keyword"] = keyword  # 나중에 search_text로 변환됨
+                # 한 번의 UPSERT 안에서 같은 행이 두 번 갱신되지 않도록 중복 제거
+                batch_df = temp_df.drop_duplicates(
+                    subset=["platform", "company", "offer"], keep="last"
+                )
+                changed_ids = self._upsert_data_to_db(batch_df, table_name=table_name)
+                # DB에 저장된 결과만 반환 대상에 포함합니다.
                 df_list.append(temp_df)
+                if on_upserted and changed_ids:
+                    on_upserted(changed_ids)
+
+            if unchanged:
+                # 결과가 지난 실행과 같으므로 추출/정제/UPSERT를 생략했습니다.
+                stats["unchanged"] += 1
+                self.counters.incr("keywords_unchanged")
+                self.counters.incr("rows_skipped", fingerprints[keyword][1])
+            elif skip_unchanged and fingerprint and not failed:
+                # UPSERT가 끝난 뒤에만 저장하여 실패한 결과를 건너뛰지 않도록 합니다.
+                self._save_keyword_fingerprint(
+                    fingerprint_table, keyword, fingerprint, len(temp_df)
+                )
 
-            # [수정] 검색 후 메인 페이지로 돌아갈 필요가 없다면 아래 라인 삭제 가능
-            self._navigate_to()
+            progress.update(1)
             time.sleep(5)
+        progress.close()
+
+        self._log_latency_report(durations, stats)
+        if skip_unchanged:
+            self.logger.info(
+                f"결과가 바뀌지 않은 키워드 {stats['unchanged']}/{len(keywords)}개를 "
+                f"건너뛰어 {self.counters.snapshot().get('rows_skipped', 0)}개 행의 "
+                "추출/정제/UPSERT를 생략했습니다."
+            )
+        self.counters.log_summary(self.logger)
 
         if not df_list:
             self.logger.warning("수집된 데이터가 전혀 없습니다.")
@@ -380,9 +780,6 @@ class AdvancedScraper:
             f"중복 제거 후 {final_df.shape[0]}개의 고유한 데이터를 확인했습니다."
         )
 
-        # [수정] 새로운 UPSERT 메소드 호출
-        self._upsert_data_to_db(final_df, table_name=table_name)
-
         return final_df
 
     def close(self):
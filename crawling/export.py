@@ -0,0 +1,196 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Optional
+
+import pandas as pd
+from sqlalchemy import Engine
+
+EXPORT_COLUMNS = [
+    "id",
+    "platform",
+    "company",
+    "company_link",
+    "offer",
+    "apply_deadline",
+    "review_deadline",
+    "address",
+    "lat",
+    "lng",
+    "img_url",
+    "search_text",
+    "updated_at",
+]
+
+
+def _write_atomic(path: str, content: str):
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 합니다."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _partition_digest(df: pd.DataFrame) -> str:
+    """파티션 내용으로부터 결정적인 해시를 계산합니다."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()[:16]
+
+
+def _to_geojson(df: pd.DataFrame) -> dict:
+    """좌표가 있는 캠페인만 GeoJSON FeatureCollection으로 변환합니다."""
+    geocoded = df[df["lat"].notna() & df["lng"].notna()]
+    features = []
+    for row in geocoded.itertuples(index=False):
+        # 문자열 컬럼의 NULL은 NaN으로 읽히므로 JSON의 null(None)로 바꿉니다.
+        properties = {
+            col: None if pd.isna(getattr(row, col)) else getattr(row, col)
+            for col in EXPORT_COLUMNS
+            if col not in ("lat", "lng")
+        }
+        for col in ("apply_deadline", "review_deadline", "updated_at"):
+            value = properties[col]
+            properties[col] = value.isoformat() if value is not None else None
+        features.append(
+            {
+                "type": "Feature",
+                # GeoJSON 좌표 순서는 (경도, 위도) 입니다.
+                "geometry": {"type": "Point", "coordinates": [row.lng, row.lat]},
+                "properties": properties,
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _prune_snapshots(output_dir: str, keep_versions: int) -> int:
+    """
+    최근 keep_versions개를 제외한 매니페스트를 지우고,
+    남은 매니페스트 어디에서도 참조하지 않는 Parquet 파일을 삭제합니다.
+    삭제한 Parquet 파일 개수를 반환합니다.
+    """
+    # 방금 쓴 최신 버전(latest.json)은 항상 남깁니다.
+    keep_versions = max(1, keep_versions)
+    snapshot_dir = os.path.join(output_dir, "snapshots")
+    manifests = sorted(
+        name
+        for name in os.listdir(snapshot_dir)
+        if name.startswith("v") and name.endswith(".json")
+    )
+    # 버전명이 UTC 타임스탬프이므로 이름순 정렬이 곧 시간순입니다.
+    for name in manifests[:-keep_versions]:
+        os.remove(os.path.join(snapshot_dir, name))
+
+    referenced = set()
+    for name in manifests[-keep_versions:]:
+        with open(os.path.join(snapshot_dir, name), encoding="utf-8") as f:
+            manifest = json.load(f)
+        referenced.update(
+            os.path.normpath(os.path.join(output_dir, partition["path"]))
+            for partition in manifest["partitions"]
+        )
+
+    removed = 0
+    parquet_dir = os.path.join(output_dir, "parquet")
+    for dir_path, _, file_names in os.walk(parquet_dir, topdown=False):
+        for file_name in file_names:
+            file_path = os.path.normpath(os.path.join(dir_path, file_name))
+            if file_name.endswith(".parquet") and file_path not in referenced:
+                os.remove(file_path)
+                removed += 1
+        if dir_path != parquet_dir and not os.listdir(dir_path):
+            os.rmdir(dir_path)
+    return removed
+
+
+def export_snapshot(
+    engine: Engine,
+    output_dir: str = "exports",
+    table_name: str = "campaign",
+    keep_versions: int = 10,
+) -> Optional[str]:
+    """
+    진행 중인 캠페인을 읽기 전용 스냅샷으로 내보냅니다.
+
+    - Parquet: apply_deadline 월(KST) 단위로 파티션을 나누고, 파일명을 내용 해시로
+      정해 바뀐 파티션만 새로 씁니다. 실행마다 버전 매니페스트(snapshots/v*.json)를
+      남기고 latest.json이 최신 버전을 가리킵니다.
+    - GeoJSON: 좌표가 있는 캠페인을 campaigns.geojson 으로 씁니다.
+
+    소비자는 OLTP 테이블 대신 매니페스트의 Parquet 파일을 메모리 맵으로 읽으면 됩니다.
+    최근 keep_versions개 버전만 남기고, 더 이상 참조되지 않는 Parquet 파일은 삭제합니다.
+    생성된 매니페스트 경로를 반환합니다.
+    """
+    # retention.archive_expired_campaigns와 동일하게 마감 당일은 진행 중으로 봅니다.
+    query = (
+        f'SELECT {", ".join(EXPORT_COLUMNS)} FROM "{table_name}" '
+        "WHERE apply_deadline >= NOW() - INTERVAL '1 day' ORDER BY id"
+    )
+    try:
+        df = pd.read_sql_query(query, engine)
+    except Exception as e:
+        logging.error(f"스냅샷 내보내기용 데이터 로딩 실패: {e}")
+        return None
+
+    # DECIMAL 컬럼은 Decimal 객체로 읽히므로 float으로 변환합니다.
+    df["lat"] = df["lat"].astype(float)
+    df["lng"] = df["lng"].astype(float)
+    for col in ("apply_deadline", "review_deadline", "updated_at"):
+        df[col] = pd.to_datetime(df[col], utc=True).dt.tz_convert("Asia/Seoul")
+
+    parquet_dir = os.path.join(output_dir, "parquet")
+    snapshot_dir = os.path.join(output_dir, "snapshots")
+    os.makedirs(parquet_dir, exist_ok=True)
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    partitions = []
+    rewritten = 0
+    apply_month = df["apply_deadline"].dt.strftime("%Y-%m")
+    for month, part_df in df.groupby(apply_month, sort=True):
+        part_df = part_df.reset_index(drop=True)
+        partition_dir = os.path.join(parquet_dir, f"apply_month={month}")
+        file_name = f"{_partition_digest(part_df)}.parquet"
+        file_path = os.path.join(partition_dir, file_name)
+
+        # 내용이 같으면 같은 파일명이 되므로 기존 파일을 그대로 재사용합니다.
+        if not os.path.exists(file_path):
+            os.makedirs(partition_dir, exist_ok=True)
+            tmp_path = f"{file_path}.tmp"
+            part_df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, file_path)
+            rewritten += 1
+
+        partitions.append(
+            {
+                "apply_month": month,
+                "path": os.path.relpath(file_path, output_dir),
+                "rows": len(part_df),
+            }
+        )
+
+    version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    manifest = {"version": version, "rows": len(df), "partitions": partitions}
+    manifest_path = os.path.join(snapshot_dir, f"v{version}.json")
+    _write_atomic(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2))
+    _write_atomic(
+        os.path.join(output_dir, "latest.json"),
+        json.dumps({"manifest": os.path.relpath(manifest_path, output_dir)}),
+    )
+
+    geojson = _to_geojson(df)
+    _write_atomic(
+        os.path.join(output_dir, "campaigns.geojson"),
+        # NaN이 남아 있으면 유효하지 않은 JSON이 되므로 바로 실패하게 합니다.
+        json.dumps(geojson, ensure_ascii=False, allow_nan=False),
+    )
+
+    pruned = _prune_snapshots(output_dir, keep_versions)
+
+    logging.info(
+        f"스냅샷 v{version} 내보내기 완료: {len(df)}개 캠페인, "
+        f"파티션 {len(partitions)}개 중 {rewritten}개 갱신, "
+        f"GeoJSON 피처 {len(geojson['features'])}개, "
+        f"이전 Parquet 파일 {pruned}개 삭제"
+    )
+    return manifest_path
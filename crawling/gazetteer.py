@@ -0,0 +1,136 @@
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 인덱스 레코드: 정규화 주소의 64bit 해시 + 위도/경도
+GAZETTEER_DTYPE = np.dtype([("key", "<u8"), ("lat", "<f8"), ("lng", "<f8")])
+
+# 주소 표기 차이를 줄이기 위한 시/도 약칭 매핑
+_SIDO_ALIASES = {
+    "서울특별시": "서울",
+    "경기도": "경기",
+    "인천광역시": "인천",
+}
+
+
+# 도로명 + 건물번호까지만 남기기 위한 패턴 (예: "종로 1", "강남대로94길 10-2")
+_ROAD_AND_BUILDING_NO = re.compile(r"^.*?(?:로|길)\s+\d+(?:-\d+)?")
+
+
+def normalize_address(address: str) -> str:
+    """
+    괄호 안 부가정보와 건물번호 뒤의 건물명/층수를 제거하고,
+    중복 공백을 정리하며 시/도 명칭을 약칭으로 통일합니다.
+    """
+    address = re.sub(r"\(.*?\)", " ", address)
+    match = _ROAD_AND_BUILDING_NO.match(address)
+    if match:
+        address = match.group(0)
+    tokens = address.split()
+    if tokens:
+        tokens[0] = _SIDO_ALIASES.get(tokens[0], tokens[0])
+    return " ".join(tokens)
+
+
+def _address_key(address: str) -> int:
+    digest = hashlib.blake2b(
+        normalize_address(address).encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+def build_gazetteer(
+    csv_path: str,
+    index_path: str,
+    address_col: str = "address",
+    lat_col: str = "lat",
+    lng_col: str = "lng",
+    encoding: str = "utf-8",
+) -> int:
+    """
+    도로명주소/좌표 데이터셋(CSV)으로부터 메모리 맵 인덱스(.npy)를 생성합니다.
+    키 기준으로 정렬해 저장하므로 조회는 이진 탐색으로 수행됩니다.
+    저장된 레코드 개수를 반환합니다.
+    """
+    df = pd.read_csv(
+        csv_path, usecols=[address_col, lat_col, lng_col], encoding=encoding
+    ).dropna()
+
+    index = np.empty(len(df), dtype=GAZETTEER_DTYPE)
+    index["key"] = np.fromiter(
+        (_address_key(str(addr)) for addr in df[address_col]),
+        dtype=np.uint64,
+        count=len(df),
+    )
+    index["lat"] = df[lat_col].astype(float).to_numpy()
+    index["lng"] = df[lng_col].astype(float).to_numpy()
+
+    # 구조체 배열의 sort(order=...)는 나머지 필드로 동률을 가르므로
+    # 키만으로 안정 정렬하여 데이터셋의 원래 순서를 유지합니다.
+    index = index[np.argsort(index["key"], kind="stable")]
+    # 동일 주소가 여러 번 등장하면 첫 번째 좌표만 남깁니다.
+    _, unique_pos = np.unique(index["key"], return_index=True)
+    index = index[unique_pos]
+
+    np.save(index_path, index)
+    logging.info(f"주소 인덱스 생성 완료: {len(index)}개 주소 -> '{index_path}'")
+    return len(index)
+
+
+class AddressGazetteer:
+    """
+    build_gazetteer로 만든 인덱스를 메모리 맵으로 열어 주소를 좌표로 변환합니다.
+    조회 적중률과 조회 지연 시간을 집계합니다.
+    """
+
+    def __init__(self, index_path: str):
+        self.index = np.load(index_path, mmap_mode="r")
+        self.keys = self.index["key"]
+        self.hits = 0
+        self.misses = 0
+        self.lookup_seconds = 0.0
+        logging.info(f"주소 인덱스 로드: {len(self.index)}개 주소 ('{index_path}')")
+
+    @classmethod
+    def from_env(cls) -> Optional["AddressGazetteer"]:
+        """GAZETTEER_INDEX_PATH 환경변수가 가리키는 인덱스가 있으면 엽니다."""
+        index_path = os.getenv("GAZETTEER_INDEX_PATH")
+        if not index_path or not os.path.exists(index_path):
+            return None
+        try:
+            return cls(index_path)
+        except Exception as e:
+            logging.warning(f"주소 인덱스 로드 실패, 지오코딩 API만 사용합니다: {e}")
+            return None
+
+    def lookup(self, address: str) -> Optional[Tuple[float, float]]:
+        """주소에 해당하는 (위도, 경도)를 반환합니다. 없으면 None."""
+        started = time.perf_counter()
+        key = np.uint64(_address_key(address))
+        pos = int(np.searchsorted(self.keys, key))
+        found = pos < len(self.keys) and self.keys[pos] == key
+        self.lookup_seconds += time.perf_counter() - started
+
+        if not found:
+            self.misses += 1
+            return None
+        self.hits += 1
+        record = self.index[pos]
+        return (float(record["lat"]), float(record["lng"]))
+
+    def report(self):
+        """조회 적중률과 평균 조회 지연 시간을 로깅합니다."""
+        total = self.hits + self.misses
+        if total == 0:
+            logging.info("주소 인덱스 조회 내역이 없습니다.")
+            return
+        logging.info(
+            f"주소 인덱스 적중률 {self.hits / total:.1%} ({self.hits}/{total}), "
+            f"평균 조회 {self.lookup_seconds / total * 1e6:.1f}µs"
+        )
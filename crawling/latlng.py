@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 from sqlalchemy import Engine, create_engine
 from dotenv import load_dotenv
 from tqdm import tqdm
@@ -14,9 +14,12 @@ import requests
 
 import os
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from .changefeed import CHANGE_CHANNEL, OUTBOX_LOCK_KEY, OUTBOX_TABLE_NAME
+from .gazetteer import AddressGazetteer
+from .log import RunCounters
+
+# 보강 단계의 API 호출/실패 집계
+ENRICH_COUNTERS = RunCounters()
 
 
 def get_db_engine() -> Optional[Engine]:
@@ -61,6 +64,7 @@ def get_place_info_from_naver(
     params = {"query": company_name, "display": 1}  # 가장 정확한 1개 결과만 요청
     url = "https://openapi.naver.com/v1/search/local.json"
 
+    ENRICH_COUNTERS.incr("place_api_calls")
     try:
         response = requests.get(url, headers=headers, params=params)
         response.raise_for_status()  # HTTP 에러 발생 시 예외 처리
@@ -68,7 +72,11 @@ def get_place_info_from_naver(
         if search_results["items"]:
             return search_results["items"][0]  # 첫 번째 결과 반환
     except requests.exceptions.RequestException as e:
-        logging.warning(f"'{company_name}' 지역 검색 API 호출 실패: {e}")
+        ENRICH_COUNTERS.incr("place_api_failures")
+        logging.warning(
+            f"'{company_name}' 지역 검색 API 호출 실패: {e}",
+            extra={"sample_key": "place_api_failure"},
+        )
     return None
 
 
@@ -82,6 +90,7 @@ def get_coords_from_naver(
     }
     params = {"query": address}
     url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
+    ENRICH_COUNTERS.incr("geocode_api_calls")
     try:
         response = requests.get(url, headers=headers, params=params)
         response.raise_for_status()
@@ -95,7 +104,11 @@ def get_coords_from_naver(
                 float(addr_info["x"]),
             )  # (위도, 경도) 순으로 반환
     except requests.exceptions.RequestException as e:
-        logging.warning(f"'{address}' 지오코딩 API 호출 실패: {e}")
+        ENRICH_COUNTERS.incr("geocode_api_failures")
+        logging.warning(
+            f"'{address}' 지오코딩 API 호출 실패: {e}",
+            extra={"sample_key": "geocode_api_failure"},
+        )
     return None
 
 
@@ -114,17 +127,147 @@ def update_campaign_data(engine: Engine, campaign_id: int, data: Dict):
     # 파라미터에 업데이트할 id 추가
     update_params = {"id": campaign_id, **update_values}
 
-    # SQL 쿼리 실행
-    query = text(f'UPDATE "campaign" SET {set_clause} WHERE id = :id')
+    # 업데이트와 아웃박스 기록을 한 문장(한 트랜잭션)으로 실행
+    query = text(
+        f'WITH updated AS (UPDATE "campaign" SET {set_clause}, updated_at = NOW() '
+        "WHERE id = :id RETURNING *) "
+        f'INSERT INTO "{OUTBOX_TABLE_NAME}" (campaign_id, op, payload) '
+        "SELECT id, 'enrich', to_jsonb(updated) FROM updated"
+    )
 
     try:
         with engine.connect() as connection:
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": OUTBOX_LOCK_KEY}
+            )
             connection.execute(query, update_params)
+            # 커밋 시점에 변경 알림이 전달됩니다.
+            connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": CHANGE_CHANNEL, "payload": str(campaign_id)},
+            )
             # 변경사항을 커밋해야 실제 DB에 반영됩니다.
             connection.commit()
         # logging.info(f"ID {campaign_id}: 성공적으로 업데이트했습니다.")
     except Exception as e:
-        logging.error(f"ID {campaign_id} 업데이트 실패: {e}")
+        ENRICH_COUNTERS.incr("update_failures")
+        logging.error(
+            f"ID {campaign_id} 업데이트 실패: {e}",
+            extra={"sample_key": "update_failure"},
+        )
+
+
+def load_naver_credentials() -> Optional[Dict[str, str]]:
+    """환경변수에서 네이버 검색/지도 API 인증 정보를 읽습니다. 하나라도 없으면 None."""
+    load_dotenv()
+    credentials = {
+        "map_client_id": os.getenv("NAVER_MAP_CLIENT_ID"),
+        "map_client_secret": os.getenv("NAVER_MAP_CLIENT_SECRET"),
+        "search_client_id": os.getenv("NAVER_SEARCH_CLIENT_ID"),
+        "search_client_secret": os.getenv("NAVER_SEARCH_CLIENT_SECRET"),
+    }
+    if not all(credentials.values()):
+        logging.critical(
+            "환경변수에서 NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET를 찾을 수 없습니다."
+        )
+        return None
+    return credentials
+
+
+def fetch_unenriched_by_ids(
+    engine: Engine, campaign_ids: List[int], table_name: str = "campaign"
+) -> pd.DataFrame:
+    """주어진 ID 중 아직 좌표가 없는 캠페인의 ID와 상호명을 불러옵니다."""
+    if not campaign_ids:
+        return pd.DataFrame()
+    query = text(
+        f'SELECT id, company FROM "{table_name}" '
+        "WHERE id = ANY(:ids) AND lat IS NULL ORDER BY id"
+    )
+    try:
+        return pd.read_sql_query(
+            query, engine, params={"ids": [int(i) for i in campaign_ids]}
+        )
+    except Exception as e:
+        logging.error(f"DB에서 보강 대상 데이터 로딩 실패: {e}")
+        return pd.DataFrame()
+
+
+def fetch_backfill_ids(
+    engine: Engine, table_name: str = "campaign", max_attempts: int = 5
+) -> List[int]:
+    """
+    아직 좌표가 없는 캠페인 중 다시 보강할 차례가 된 캠페인의 ID를 불러옵니다.
+    보강에 실패할 때마다 재시도 간격을 1, 2, 4, ... 시간으로 늘리고,
+    max_attempts회 실패한 캠페인은 더 이상 조회하지 않습니다.
+    """
+    query = text(
+        f'SELECT id FROM "{table_name}" '
+        "WHERE lat IS NULL AND enrich_attempts < :max_attempts "
+        "AND (enrich_attempted_at IS NULL OR enrich_attempted_at < "
+        "NOW() - make_interval(hours => power(2, enrich_attempts)::int)) "
+        "ORDER BY id"
+    )
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(query, {"max_attempts": max_attempts})
+            campaign_ids = [row[0] for row in rows]
+        logging.info(f"좌표가 없는 캠페인 {len(campaign_ids)}개를 다시 보강합니다.")
+        return campaign_ids
+    except Exception as e:
+        logging.error(f"DB에서 재보강 대상 ID 로딩 실패: {e}")
+        return []
+
+
+def record_enrich_failure(engine: Engine, campaign_id: int, table_name: str = "campaign"):
+    """좌표를 얻지 못한 보강 시도를 기록해 다음 재시도를 늦춥니다."""
+    query = text(
+        f'UPDATE "{table_name}" SET enrich_attempts = enrich_attempts + 1, '
+        "enrich_attempted_at = NOW() WHERE id = :id"
+    )
+    try:
+        with engine.begin() as connection:
+            connection.execute(query, {"id": campaign_id})
+    except Exception as e:
+        logging.error(
+            f"ID {campaign_id} 보강 시도 기록 실패: {e}",
+            extra={"sample_key": "enrich_attempt_failure"},
+        )
+
+
+def build_enrichment_data(
+    company_name: str,
+    credentials: Dict[str, str],
+    gazetteer: Optional[AddressGazetteer] = None,
+) -> Dict:
+    """상호명으로 주소, 좌표, 링크를 조회해 DB에 반영할 데이터를 만듭니다."""
+    place_info = get_place_info_from_naver(
+        client_id=credentials["search_client_id"],
+        client_secret=credentials["search_client_secret"],
+        company_name=company_name,
+    )
+    if not place_info:
+        return {}
+
+    address = place_info.get("roadAddress", place_info.get("address"))
+    # 'thubnail'을 'img_url'로 매핑
+    img_url = place_info.get("link")
+
+    # 로컬 주소 인덱스가 있으면 지오코딩 API보다 먼저 조회합니다.
+    coords = None
+    if address and gazetteer:
+        coords = gazetteer.lookup(address)
+    if address and not coords:
+        coords = get_coords_from_naver(
+            credentials["map_client_id"], credentials["map_client_secret"], address
+        )
+
+    return {
+        "address": address,
+        "lat": coords[0] if coords else None,
+        "lng": coords[1] if coords else None,
+        "img_url": img_url,
+    }
 
 
 def enrich_and_update_db():
@@ -138,22 +281,12 @@ def enrich_and_update_db():
     if not db_engine:
         exit()
 
-    naver_map_client_id = os.getenv("NAVER_MAP_CLIENT_ID")
-    naver_map_client_secret = os.getenv("NAVER_MAP_CLIENT_SECRET")
-    naver_search_client_id = os.getenv("NAVER_SEARCH_CLIENT_ID")
-    naver_search_client_secret = os.getenv("NAVER_SEARCH_CLIENT_SECRET")
-
-    if not (
-        naver_map_client_id
-        and naver_map_client_secret
-        and naver_search_client_id
-        and naver_search_client_secret
-    ):
-        logging.critical(
-            "환경변수에서 NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET를 찾을 수 없습니다."
-        )
+    credentials = load_naver_credentials()
+    if not credentials:
         exit()
 
+    gazetteer = AddressGazetteer.from_env()
+
     original_df = fetch_data_from_db(
         db_engine, DB_TABLE_NAME, COMPANY_COLUMN_NAME, ID_COLUMN_NAME
     )
@@ -170,32 +303,7 @@ def enrich_and_update_db():
         campaign_id = row[ID_COLUMN_NAME]
         company_name = row[COMPANY_COLUMN_NAME]
 
-        place_info = get_place_info_from_naver(
-            client_id=naver_search_client_id,
-            client_secret=naver_search_client_secret,
-            company_name=company_name,
-        )
-
-        new_data = {}
-        if place_info:
-            address = place_info.get("roadAddress", place_info.get("address"))
-            # 'thubnail'을 'img_url'로 매핑
-            img_url = place_info.get("link")
-
-            coords = (
-                get_coords_from_naver(
-                    naver_map_client_id, naver_map_client_secret, address
-                )
-                if address
-                else None
-            )
-
-            new_data = {
-                "address": address,
-                "lat": coords[0] if coords else None,
-                "lng": coords[1] if coords else None,
-                "img_url": img_url,
-            }
+        new_data = build_enrichment_data(company_name, credentials, gazetteer)
 
         # 새로운 정보가 있을 경우에만 DB 업데이트 함수 호출
         if new_data:
@@ -203,4 +311,7 @@ def enrich_and_update_db():
 
         time.sleep(0.1)
 
+    if gazetteer:
+        gazetteer.report()
+    ENRICH_COUNTERS.log_summary(logging.getLogger(), "보강 통계")
     logging.info("모든 작업이 완료되었습니다.")
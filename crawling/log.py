@@ -0,0 +1,110 @@
+import atexit
+import json
+import logging
+import queue
+import threading
+from collections import Counter
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+DEFAULT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 로거 이름별로 실행 중인 QueueListener (중복 설정 방지)
+_LISTENERS: Dict[str, QueueListener] = {}
+
+
+class SamplingFilter(logging.Filter):
+    """
+    extra={"sample_key": ...}가 붙은 반복 메시지를 샘플링합니다.
+    키마다 처음 burst개는 그대로 통과시키고, 이후에는 every개마다 1개만 남기며
+    생략된 건수를 메시지 끝에 덧붙입니다. sample_key가 없는 로그는 그대로 통과합니다.
+    """
+
+    def __init__(self, burst: int = 5, every: int = 100):
+        super().__init__()
+        self.burst = burst
+        self.every = every
+        self.seen: Counter = Counter()
+        self.suppressed: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample_key", None)
+        if key is None:
+            return True
+
+        with self._lock:
+            self.seen[key] += 1
+            count = self.seen[key]
+            if count <= self.burst or (count - self.burst) % self.every == 0:
+                suppressed = self.suppressed.pop(key, 0)
+            else:
+                self.suppressed[key] += 1
+                return False
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} (유사 메시지 {suppressed}건 생략)"
+            record.args = ()
+        return True
+
+
+class RunCounters:
+    """실행 단위의 구조화된 카운터. 여러 스레드에서 안전하게 증가시킬 수 있습니다."""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def log_summary(self, logger: logging.Logger, title: str = "실행 통계"):
+        """카운터를 JSON 한 줄로 로깅합니다."""
+        logger.info(f"{title}: {json.dumps(self.snapshot(), ensure_ascii=False)}")
+
+
+def setup_queue_logging(
+    logger: logging.Logger,
+    file_path: Optional[str] = None,
+    level: int = logging.INFO,
+    sampling_filter: Optional[SamplingFilter] = None,
+) -> QueueListener:
+    """
+    로거에 QueueHandler만 연결하고, 실제 콘솔/파일 출력은 QueueListener의
+    백그라운드 스레드에서 처리합니다. 스크래핑/보강 루프에서 로깅하더라도
+    디스크 I/O를 기다리지 않습니다. 시작된 리스너를 반환합니다.
+    이미 설정된 로거라면 새 리스너/핸들러를 만들지 않고 기존 리스너를 반환합니다.
+    """
+    if logger.name in _LISTENERS:
+        return _LISTENERS[logger.name]
+
+    logger.setLevel(level)
+    if logger.hasHandlers():
+        logger.handlers.clear()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+    handlers = [stream_handler]
+
+    if file_path:
+        file_handler = logging.FileHandler(file_path)
+        file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(sampling_filter or SamplingFilter())
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # 프로세스 종료 시 큐에 남은 로그를 모두 출력합니다.
+    atexit.register(listener.stop)
+    _LISTENERS[logger.name] = listener
+    return listener
@@ -0,0 +1,101 @@
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import Engine
+
+from .gazetteer import AddressGazetteer
+from .latlng import (
+    ENRICH_COUNTERS,
+    build_enrichment_data,
+    fetch_backfill_ids,
+    fetch_unenriched_by_ids,
+    record_enrich_failure,
+    update_campaign_data,
+)
+
+
+class EnrichmentWorker(threading.Thread):
+    """
+    스크래핑과 동시에 실행되는 보강(enrich) 단계.
+    _upsert_data_to_db가 반환한 신규/변경 캠페인 ID를 큐로 받아,
+    브라우저가 다음 키워드를 처리하는 동안 지오코딩하여 DB에 반영합니다.
+    """
+
+    _STOP = object()
+    _BACKFILL = object()
+
+    def __init__(
+        self,
+        engine: Engine,
+        credentials: Dict[str, str],
+        gazetteer: Optional[AddressGazetteer] = None,
+        request_interval: float = 0.1,
+    ):
+        super().__init__(name="EnrichmentWorker", daemon=True)
+        self.engine = engine
+        self.credentials = credentials
+        self.gazetteer = gazetteer
+        self.request_interval = request_interval
+        self.queue: "queue.Queue" = queue.Queue()
+        self.enriched = 0
+        self.lag_seconds: List[float] = []
+
+    def submit(self, campaign_ids: List[int]):
+        """보강할 캠페인 ID 묶음을 큐에 넣습니다. (execute_scraping의 on_upserted 콜백)"""
+        if campaign_ids:
+            self.queue.put((time.monotonic(), list(campaign_ids)))
+
+    def submit_backfill(self):
+        """
+        앞서 넣은 작업을 모두 처리한 뒤, 아직 좌표가 없는 캠페인을 다시 보강하도록 예약합니다.
+        대상은 큐가 비워진 시점에 fetch_backfill_ids로 조회하므로, 이번 실행에서 이미
+        실패한 캠페인은 백오프 조건에 따라 제외됩니다.
+        """
+        self.queue.put(self._BACKFILL)
+
+    def close(self):
+        """남은 작업을 모두 처리한 뒤 워커를 종료합니다."""
+        self.queue.put(self._STOP)
+        self.join()
+        if self.lag_seconds:
+            logging.info(
+                f"파이프라인 보강 완료: {self.enriched}개 캠페인, "
+                f"스크랩 후 반영까지 평균 {sum(self.lag_seconds) / len(self.lag_seconds):.1f}s, "
+                f"최대 {max(self.lag_seconds):.1f}s"
+            )
+        if self.gazetteer:
+            self.gazetteer.report()
+        ENRICH_COUNTERS.log_summary(logging.getLogger(), "보강 통계")
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is self._STOP:
+                break
+            if item is self._BACKFILL:
+                item = (time.monotonic(), fetch_backfill_ids(self.engine))
+            submitted_at, campaign_ids = item
+            try:
+                self._enrich(campaign_ids)
+            except Exception as e:
+                # 한 묶음의 실패가 스크래핑 전체를 멈추지 않도록 기록만 합니다.
+                logging.error(f"캠페인 {len(campaign_ids)}개 보강 중 오류 발생: {e}")
+            self.lag_seconds.append(time.monotonic() - submitted_at)
+
+    def _enrich(self, campaign_ids: List[int]):
+        df = fetch_unenriched_by_ids(self.engine, campaign_ids)
+        for row in df.itertuples(index=False):
+            new_data = build_enrichment_data(
+                row.company, self.credentials, self.gazetteer
+            )
+            if new_data:
+                update_campaign_data(self.engine, row.id, new_data)
+            if new_data.get("lat") is None:
+                # 일시적인 API 실패 등으로 좌표를 못 얻은 경우, 다음 실행에서 백오프 후 재시도
+                record_enrich_failure(self.engine, row.id)
+            else:
+                self.enriched += 1
+            time.sleep(self.request_interval)
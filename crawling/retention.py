@@ -0,0 +1,91 @@
+import logging
+from sqlalchemy import Engine, text
+
+from .changefeed import CHANGE_CHANNEL, OUTBOX_LOCK_KEY, OUTBOX_TABLE_NAME
+
+# apply_deadline은 마감일 00:00(KST)으로 저장되므로 마감 당일 하루는 진행 중으로 봅니다.
+RETENTION_GRACE_DAYS = 1
+
+# 아카이브로 옮기는 컬럼. 열 위치에 의존하지 않도록 명시적으로 나열합니다.
+ARCHIVE_COLUMNS = [
+    "id",
+    "platform",
+    "company",
+    "company_link",
+    "offer",
+    "apply_deadline",
+    "review_deadline",
+    "address",
+    "lat",
+    "lng",
+    "img_url",
+    "search_text",
+    "created_at",
+    "updated_at",
+]
+
+
+def archive_expired_campaigns(
+    engine: Engine,
+    table_name: str = "campaign",
+    archive_table_name: str = "campaign_archive",
+    grace_days: int = RETENTION_GRACE_DAYS,
+    batch_size: int = 5000,
+) -> int:
+    """
+    모집 마감(apply_deadline)이 지난 캠페인을 아카이브 테이블로 옮깁니다.
+    hot 테이블에는 진행 중인 캠페인만 남겨 UPSERT 충돌 검사와
+    보강(enrich) 조회, 소비자 쿼리가 살아있는 행만 다루도록 합니다.
+    이동한 행은 변경 이벤트(op='archive')로도 기록됩니다.
+    이동한 행의 개수를 반환합니다.
+    """
+    # 배치 단위로 DELETE ... RETURNING 결과를 그대로 아카이브에 INSERT 하여
+    # 한 트랜잭션 안에서 이동하고, 긴 잠금을 피합니다.
+    archive_cols = ", ".join(ARCHIVE_COLUMNS)
+    query = text(
+        f"""
+        WITH moved AS (
+            DELETE FROM "{table_name}"
+            WHERE id IN (
+                SELECT id FROM "{table_name}"
+                WHERE apply_deadline < NOW() - make_interval(days => :grace_days)
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING *
+        ),
+        archived AS (
+            INSERT INTO "{archive_table_name}" ({archive_cols})
+            SELECT {archive_cols} FROM moved
+        )
+        INSERT INTO "{OUTBOX_TABLE_NAME}" (campaign_id, op, payload)
+        SELECT id, 'archive', to_jsonb(moved) FROM moved
+        """
+    )
+
+    total_moved = 0
+    try:
+        while True:
+            with engine.begin() as connection:
+                connection.execute(
+                    text("SELECT pg_advisory_xact_lock(:key)"),
+                    {"key": OUTBOX_LOCK_KEY},
+                )
+                result = connection.execute(
+                    query, {"grace_days": grace_days, "batch_size": batch_size}
+                )
+                moved = result.rowcount
+                if moved:
+                    connection.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": CHANGE_CHANNEL, "payload": str(moved)},
+                    )
+            total_moved += moved
+            if moved < batch_size:
+                break
+        logging.info(
+            f"마감된 캠페인 {total_moved}개를 '{archive_table_name}' 테이블로 옮겼습니다."
+        )
+    except Exception as e:
+        logging.error(f"만료 캠페인 아카이브 실패: {e}")
+    return total_moved
@@ -1,10 +1,17 @@
-import time
-
-from crawling import AdvancedScraper, enrich_and_update_db
+from crawling import (
+    AdvancedScraper,
+    AddressGazetteer,
+    EnrichmentWorker,
+    get_db_engine,
+    load_naver_credentials,
+    archive_expired_campaigns,
+    export_snapshot,
+)
+from crawling.log import setup_queue_logging
 import logging
 
 
-def scrape(table_name):
+def scrape(table_name, on_upserted=None):
     # --- 실행 예시 ---
     BASE_URL = "https://inflexer.net"  # 실제 스크래핑할 URL로 변경하세요.
     SEARCH_KEYWORDS = [
@@ -81,7 +88,7 @@ def scrape(table_name):
         # 헤드리스 모드로 실행하려면 headless=True 전달
         scraper = AdvancedScraper(url=BASE_URL, headless=False)
         final_data = scraper.execute_scraping(
-            keywords=SEARCH_KEYWORDS, table_name=table_name
+            keywords=SEARCH_KEYWORDS, table_name=table_name, on_upserted=on_upserted
         )
         print("\n--- 최종 통합 데이터 (일부) ---")
         print(final_data.head())
@@ -97,6 +104,28 @@ def scrape(table_name):
 
 
 if __name__ == "__main__":
-    scrape(table_name="campaign")
-    time.sleep(5)
-    enrich_and_update_db()
+    # 루트 로거 출력은 큐 리스너 스레드가 담당하여 보강 루프가 I/O를 기다리지 않습니다.
+    setup_queue_logging(logging.getLogger())
+
+    db_engine = get_db_engine()
+    credentials = load_naver_credentials()
+    if not (db_engine and credentials):
+        exit()
+
+    # 마감된 캠페인을 먼저 아카이브로 옮겨 hot 테이블을 가볍게 유지
+    archive_expired_campaigns(db_engine)
+
+    # 스크래핑과 동시에 신규/변경 캠페인을 보강하는 워커
+    enrich_worker = EnrichmentWorker(
+        db_engine, credentials, gazetteer=AddressGazetteer.from_env()
+    )
+    enrich_worker.start()
+    try:
+        scrape(table_name="campaign", on_upserted=enrich_worker.submit)
+        # 이번 실행에서 바뀌지 않았지만 아직 좌표가 없는 캠페인도 다시 보강합니다.
+        enrich_worker.submit_backfill()
+    finally:
+        enrich_worker.close()
+
+    # 소비자가 OLTP 테이블 대신 읽을 수 있도록 스냅샷 내보내기
+    export_snapshot(db_engine)
@@ -0,0 +1,58 @@
+import json
+
+import pandas as pd
+
+from crawling.export import EXPORT_COLUMNS, _to_geojson
+
+
+def test_geojson_maps_missing_strings_to_null():
+    deadline = pd.Timestamp("2026-10-25", tz="Asia/Seoul")
+    df = pd.DataFrame(
+        [
+            {
+                "id": 1,
+                "platform": "플랫폼",
+                "company": "가게1",
+                "company_link": None,
+                "offer": "제공 내역",
+                "apply_deadline": deadline,
+                "review_deadline": deadline,
+                "address": "서울특별시 종로구 종로 1",
+                "lat": 37.57,
+                "lng": 126.978,
+                "img_url": None,
+                "search_text": None,
+                "updated_at": deadline,
+            },
+            {
+                "id": 2,
+                "platform": "플랫폼",
+                "company": "가게2",
+                "company_link": "https://example.com/2",
+                "offer": "제공 내역",
+                "apply_deadline": deadline,
+                "review_deadline": deadline,
+                "address": None,
+                "lat": None,
+                "lng": None,
+                "img_url": None,
+                "search_text": None,
+                "updated_at": deadline,
+            },
+        ],
+        columns=EXPORT_COLUMNS,
+    )
+    df["lat"] = df["lat"].astype(float)
+    df["lng"] = df["lng"].astype(float)
+    # SQL에서 읽은 문자열 컬럼처럼 NULL이 NaN으로 표현되도록 합니다.
+    for col in ("company_link", "img_url", "search_text"):
+        df[col] = df[col].astype("str").where(df[col].notna(), float("nan"))
+
+    geojson = _to_geojson(df)
+
+    assert len(geojson["features"]) == 1
+    properties = geojson["features"][0]["properties"]
+    assert properties["company_link"] is None
+    assert properties["img_url"] is None
+    assert properties["apply_deadline"] == deadline.isoformat()
+    json.loads(json.dumps(geojson, ensure_ascii=False, allow_nan=False))
@@ -0,0 +1,101 @@
+import logging
+
+from selenium.common.exceptions import NoSuchElementException
+
+from crawling.crawling import AdvancedScraper
+from crawling.log import RunCounters
+
+
+class FakeElement:
+    def __init__(self, text="", href=None, children=None):
+        self.text = text
+        self.href = href
+        self.children = children or []
+
+    def find_element(self, by, value):
+        if self.href is None:
+            raise NoSuchElementException(value)
+        return FakeElement(href=self.href)
+
+    def find_elements(self, by, value):
+        return list(self.children)
+
+    def get_attribute(self, name):
+        return self.href
+
+
+def make_row(company):
+    return FakeElement(
+        children=[
+            FakeElement("플랫폼"),
+            FakeElement(company, href=f"https://example.com/{company}"),
+            FakeElement("제공 내역"),
+            FakeElement("~10/25"),
+            FakeElement("11/05"),
+        ]
+    )
+
+
+class GrowingTableBody:
+    """find_elements가 호출될 때마다 대기 중인 행이 하나씩 렌더링되는 tbody."""
+
+    def __init__(self, rendered, pending=()):
+        self.rendered = list(rendered)
+        self.pending = list(pending)
+
+    def find_elements(self, by, value):
+        rows = list(self.rendered)
+        if self.pending:
+            self.rendered.append(self.pending.pop(0))
+        return rows
+
+    def get_attribute(self, name):
+        return "".join(f"<tr>{row.children[1].text}</tr>" for row in self.rendered)
+
+
+class FakeDriver:
+    def __init__(self, table_body):
+        self.table_body = table_body
+
+    def find_element(self, by, value):
+        return self.table_body
+
+
+def make_scraper(table_body):
+    scraper = AdvancedScraper.__new__(AdvancedScraper)
+    scraper.logger = logging.getLogger("test_fingerprint")
+    scraper.counters = RunCounters()
+    scraper.driver = FakeDriver(table_body)
+    scraper._keyword_deadline = None
+    return scraper
+
+
+def test_fingerprint_dropped_when_table_grows_during_extraction():
+    table_body = GrowingTableBody(
+        [make_row("가게1")], pending=[make_row("가게2"), make_row("가게3")]
+    )
+    scraper = make_scraper(table_body)
+
+    df, fingerprint, unchanged = scraper._read_result_table("서울 강남")
+
+    assert not unchanged
+    assert fingerprint is None
+    assert len(df) == 2
+
+
+def test_stable_table_is_fingerprinted_and_skipped_next_time():
+    rows = [make_row("가게1"), make_row("가게2")]
+    scraper = make_scraper(GrowingTableBody(rows))
+
+    df, fingerprint, unchanged = scraper._read_result_table("서울 강남")
+    assert fingerprint is not None
+    assert not unchanged
+    assert len(df) == 2
+
+    scraper = make_scraper(GrowingTableBody(rows))
+    df, same_fingerprint, unchanged = scraper._read_result_table(
+        "서울 강남", previous_fingerprint=fingerprint
+    )
+    assert unchanged
+    assert same_fingerprint == fingerprint
+    assert df.empty
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from crawling.gazetteer import AddressGazetteer, build_gazetteer, normalize_address
+
+
+def test_normalize_address_drops_building_name_and_floor():
+    assert (
+        normalize_address("서울특별시 종로구 종로 1 교보생명빌딩 지하1층")
+        == "서울 종로구 종로 1"
+    )
+    assert (
+        normalize_address("서울특별시 강남구 강남대로94길 10-2 (역삼동) 2층")
+        == "서울 강남구 강남대로94길 10-2"
+    )
+
+
+def test_lookup_matches_naver_road_address(tmp_path):
+    csv_path = tmp_path / "road_address.csv"
+    index_path = tmp_path / "gazetteer.npy"
+    pd.DataFrame(
+        {
+            "address": [
+                "서울특별시 종로구 종로 1",
+                "서울특별시 종로구 종로 1",
+                "경기도 수원시 팔달구 효원로 241",
+            ],
+            "lat": [37.570, 0.0, 37.263],
+            "lng": [126.978, 0.0, 127.028],
+        }
+    ).to_csv(csv_path, index=False)
+
+    assert build_gazetteer(str(csv_path), str(index_path)) == 2
+
+    gazetteer = AddressGazetteer(str(index_path))
+    # 중복 주소는 데이터셋에서 먼저 나온 좌표를 사용합니다.
+    assert gazetteer.lookup("서울특별시 종로구 종로 1 교보생명빌딩 지하1층") == (
+        37.570,
+        126.978,
+    )
+    assert gazetteer.lookup("인천광역시 중구 공항로 272") is None
+    assert (gazetteer.hits, gazetteer.misses) == (1, 1)
@@ -0,0 +1,30 @@
+import logging
+
+import pandas as pd
+
+from crawling.crawling import AdvancedScraper
+from crawling.log import RunCounters
+
+
+def test_drop_expired_rows_uses_retention_grace_period():
+    scraper = AdvancedScraper.__new__(AdvancedScraper)
+    scraper.logger = logging.getLogger("test_retention")
+    scraper.counters = RunCounters()
+
+    today = pd.Timestamp.now(tz="Asia/Seoul").normalize()
+    df = pd.DataFrame(
+        {
+            "company": ["마감 지남", "오늘 마감", "진행 중"],
+            "apply_deadline": [
+                today - pd.Timedelta(days=3),
+                today,
+                today + pd.Timedelta(days=7),
+            ],
+        }
+    )
+    df["apply_deadline"] = df["apply_deadline"].astype("object")
+
+    live = scraper._drop_expired_rows(df)
+
+    assert live["company"].tolist() == ["오늘 마감", "진행 중"]
+    assert scraper.counters.snapshot() == {"rows_expired_skipped": 1}